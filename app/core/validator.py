@@ -1,33 +1,82 @@
-import re
-import ipaddress
+import logging
+import os
+import numpy as np
 import pandas as pd
-from typing import Any, Dict, List, Callable
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Any, Dict, Iterator, List, Callable, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from .interfaces import ValidatorInterface
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(frozen=True)
 class ModificationRecord:
+    # Declared by hand rather than with dataclass(slots=True) to stay compatible with Python 3.9.
+    __slots__ = ('index', 'original_value', 'replaced_value', 'validator')
+
     index: Any
     original_value: Any
     replaced_value: Any
     validator: str
 
 
+# eq=False: the generated __eq__ would compare the arrays elementwise and fail.
+@dataclass(eq=False)
+class ColumnModifications:
+    """
+    Modifications made to a single column, stored as parallel arrays with one entry per replaced row.
+    Iterating yields the equivalent ModificationRecord objects.
+    """
+    indices: np.ndarray
+    original_values: np.ndarray
+    validators: np.ndarray
+    replaced_value: Any
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[ModificationRecord]:
+        # tolist() yields plain Python values, so records serialize like the former list-based report.
+        for idx, original_value, validator in zip(self.indices.tolist(), self.original_values.tolist(), self.validators.tolist()):
+            yield ModificationRecord(
+                index=idx,
+                original_value=original_value,
+                replaced_value=self.replaced_value,
+                validator=validator
+            )
+
+
+_ARROW_STRING = pd.StringDtype("pyarrow")
+
+# The patterns below are matched by Arrow (RE2), where \d only matches ASCII digits. Where the
+# original patterns used Python's Unicode-aware \d, they use \p{Nd}, its RE2 equivalent, so
+# non-ASCII decimal digits are accepted as before. [0-9] marks checks that are ASCII-only on purpose.
+_FRACTION_PATTERN = r"\.\p{Nd}+$"
+_DATE_PATTERN = r"^\p{Nd}{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\p{Nd}|3[01]) ([01]\p{Nd}|2[0-3]):[0-5]\p{Nd}:[0-5]\p{Nd}$"
+# Four 0-255 octets without leading zeros, matching what ipaddress.IPv4Address accepts.
+_IPV4_PATTERN = r"(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+# The literals pd.to_numeric accepts: decimal or scientific notation, inf, infinity and nan.
+_NUMBER_PATTERN = r"(?i)^[+-]?(?:(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:e[+-]?[0-9]+)?|inf(?:inity)?|nan)$"
+_INFINITY_PATTERN = r"(?i)^[+-]?inf(?:inity)?$"
+
+
+def _stripped_strings(series: pd.Series) -> pd.Series:
+    """
+    Returns the series as Arrow-backed strings with surrounding whitespace removed,
+    so the .str operations run as Arrow compute kernels instead of per Python object.
+    """
+    return series.astype(_ARROW_STRING).str.strip()
+
+
 def is_invalid_date(series: pd.Series) -> pd.Series:
-    pattern = r"^(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01]) ([01]\d|2[0-3]):([0-5]\d):([0-5]\d)$"
-    regex = re.compile(pattern)
-    invalid_mask = []
-    for item in series:
-        is_invalid = True
-        if pd.isna(item):
-            is_invalid = False
-        elif isinstance(item, str):
-            if regex.fullmatch(item.strip()):
-                is_invalid = False
-        invalid_mask.append(is_invalid)
-    final_mask = pd.Series(invalid_mask, index=series.index)
-    return final_mask & series.notna()
+    """Checks for values that are not 'YYYY-MM-DD HH:MM:SS' timestamps."""
+    stripped = _stripped_strings(series)
+    valid = stripped.str.fullmatch(_DATE_PATTERN).fillna(False).astype(bool)
+    return series.notna() & ~valid
 
 
 def remove_microseconds_regex_inplace(df: pd.DataFrame, columns: List[str]) -> None:
@@ -38,45 +87,154 @@ def remove_microseconds_regex_inplace(df: pd.DataFrame, columns: List[str]) -> N
     for col in columns:
         if col in df.columns:
             try:
-                df[col] = df[col].fillna('').astype(str).str.replace(regex_pattern, "", regex=True)
+                column = df[col]
+                if isinstance(column.dtype, pd.ArrowDtype) and pa.types.is_string(column.dtype.pyarrow_dtype):
+                    # One Arrow kernel pass over the string buffer instead of fillna/astype/str copies.
+                    stripped = pc.replace_substring_regex(pa.array(column.array), pattern=_FRACTION_PATTERN, replacement='')
+                    df[col] = pd.Series(pd.arrays.ArrowExtensionArray(pc.fill_null(stripped, '')), index=column.index)
+                else:
+                    df[col] = column.fillna('').astype(str).str.replace(regex_pattern, "", regex=True)
             except Exception as e:
-                print(f"  ERROR processing column '{col}': {e}")
+                logger.error("Error processing column '%s': %s", col, e)
         else:
-            print(f"  Warning: Column '{col}' not found in DataFrame.")
+            logger.debug("Column '%s' not found in DataFrame.", col)
     return
 
 
 def is_invalid_ipv4(series: pd.Series) -> pd.Series:
     """Checks for values that are not valid IPv4 addresses."""
-    invalid_mask_list = []
-    for item in series:
-        is_invalid = True
-        if pd.notna(item) and isinstance(item, str):
-            try:
-                ipaddress.IPv4Address(item.strip())
-                is_invalid = False
-            except ValueError:
-                is_invalid = True
-        if pd.isna(item):
-            invalid_mask_list.append(False)
-        else:
-            invalid_mask_list.append(is_invalid)
-    return pd.Series(invalid_mask_list, index=series.index)
+    stripped = _stripped_strings(series)
+    valid = stripped.str.fullmatch(_IPV4_PATTERN).fillna(False).astype(bool)
+    return series.notna() & ~valid
+
+
+def _positive_arrow_numbers(series: pd.Series) -> pd.Series:
+    """
+    Parses an Arrow string series as pd.to_numeric(errors='coerce') would, but with Arrow kernels,
+    and returns whether each value is a number greater than 0.
+    """
+    raw = pa.array(series.array)
+    text = pc.ascii_trim_whitespace(raw)
+    parsable = pc.match_substring_regex(text, _NUMBER_PATTERN)
+    numbers = pc.cast(pc.if_else(parsable, text, pa.scalar(None, text.type)), pa.float64())
+    # pd.to_numeric gives NaN for out-of-range literals and for inf surrounded by whitespace,
+    # both of which Arrow parses as infinity.
+    overflowed = pc.and_(pc.is_inf(numbers), pc.invert(pc.match_substring_regex(raw, _INFINITY_PATTERN)))
+    positive = pc.fill_null(pc.and_kleene(pc.greater(numbers, 0), pc.invert(overflowed)), False)
+    return pd.Series(positive.to_numpy(zero_copy_only=False), index=series.index)
 
 
 def is_invalid_positive_numeric(series: pd.Series) -> pd.Series:
     """Checks for values that are not numbers strictly greater than 0."""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.notna() & (series <= 0)
+    if isinstance(series.dtype, pd.ArrowDtype) and pa.types.is_string(series.dtype.pyarrow_dtype):
+        return series.notna() & ~_positive_arrow_numbers(series)
+    if isinstance(series.dtype, pd.ArrowDtype):
+        # to_numeric coerces unparsable Arrow strings to NaN rather than a missing value.
+        series = series.astype(_ARROW_STRING)
     numeric_vals = pd.to_numeric(series, errors='coerce')
     invalid_mask = ((numeric_vals.isna() & series.notna()) |
                     (numeric_vals.notna() & (numeric_vals <= 0)))
     return invalid_mask
 
 
+def _compute_mask(
+    validator_func: Callable[[pd.Series], pd.Series],
+    validator_name: str,
+    col_name: str,
+    series: pd.Series
+) -> Optional[np.ndarray]:
+    """Runs a single validator on a column and returns its mask as a bool array, or None if it cannot be used."""
+    try:
+        invalid_mask = validator_func(series)
+    except Exception as e:
+        logger.error("Error applying validator '%s' to column '%s': %s", validator_name, col_name, e)
+        return None
+
+    try:
+        if not series.index.equals(invalid_mask.index):
+            logger.warning("[%s]: DataFrame index and mask index DO NOT MATCH for validator '%s'!", col_name, validator_name)
+            if len(series.index) == len(invalid_mask.index):
+                logger.debug("Attempting to reindex mask...")
+                try:
+                    invalid_mask = invalid_mask.reindex(series.index)
+                except Exception as reindex_e:
+                    logger.error("Failed to reindex mask: %s. Skipping.", reindex_e)
+                    return None
+            else:
+                logger.error("Length mismatch (DF: %d, Mask: %d). Skipping.", len(series.index), len(invalid_mask.index))
+                return None
+        if invalid_mask.isna().any():
+            logger.error("Mask from validator '%s' has missing values for column '%s'. Skipping.", validator_name, col_name)
+            return None
+        return invalid_mask.to_numpy(dtype=bool)
+    except Exception as e:
+        logger.error("Error reading mask for column '%s' from validator '%s': %s", col_name, validator_name, e)
+        return None
+
+
+def _validate_column(
+    col_name: str,
+    series: pd.Series,
+    validators: List[Tuple[Callable[[pd.Series], pd.Series], str]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Combines the masks of every validator for one column.
+    Returns the combined mask and, per row, the name of the first validator that flagged it.
+    """
+    mask = np.zeros(len(series), dtype=bool)
+    flagged_by = np.empty(len(series), dtype=object)
+    for validator_func, validator_name in validators:
+        validator_mask = _compute_mask(validator_func, validator_name, col_name, series)
+        if validator_mask is None:
+            continue
+        flagged_by[validator_mask & ~mask] = validator_name
+        mask |= validator_mask
+    return mask, flagged_by
+
+
+def _validate_columns(
+    df: pd.DataFrame,
+    column_validators: Dict[str, List[Tuple[Callable[[pd.Series], pd.Series], str]]],
+    max_workers: Optional[int] = None
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Runs _validate_column for every column, in the order of column_validators.
+    Columns are independent, so they are validated on up to max_workers threads (default: one
+    per CPU); the vectorized validators spend most of their time in C kernels that release the GIL.
+    """
+    columns = list(column_validators)
+    workers = min(len(columns), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [_validate_column(col_name, df[col_name], column_validators[col_name]) for col_name in columns]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            lambda col_name: _validate_column(col_name, df[col_name], column_validators[col_name]),
+            columns
+        ))
+
+
+def _replace_invalid(df: pd.DataFrame, col_name: str, mask_np: np.ndarray, replacement_value: Any) -> None:
+    """
+    Writes replacement_value into the masked rows of a column. The column keeps its dtype when
+    the value fits it (e.g. text into Arrow-backed strings) and becomes object dtype otherwise.
+    """
+    column = df[col_name]
+    try:
+        df[col_name] = column.mask(mask_np, replacement_value)
+    except (TypeError, ValueError):
+        values = column.to_numpy(dtype=object, copy=True)
+        values[mask_np] = replacement_value
+        df[col_name] = values
+
+
 def apply_validations_inplace(
     df: pd.DataFrame,
     rules: Dict[Callable[[pd.Series], pd.Series], List[str]],
-    replacement_value: Any = ' '
-) -> Dict[str, List[ModificationRecord]]:
+    replacement_value: Any = ' ',
+    report: bool = True
+) -> Dict[str, ColumnModifications]:
     """
     Applies validation rules in-place on the DataFrame and returns a detailed modifications report.
 
@@ -84,15 +242,17 @@ def apply_validations_inplace(
         df: The DataFrame to validate.
         rules: A dictionary mapping validation functions to a list of column names to validate.
         replacement_value: The value to replace invalid entries with.
+        report: Whether to build the modifications report; when False an empty dictionary is returned.
 
     Returns:
-        A dictionary where keys are column names and values are lists of ModificationRecord detailing changes.
+        A dictionary where keys are column names and values are ColumnModifications detailing changes.
     """
-    modifications_report: Dict[str, List[ModificationRecord]] = {}
+    modifications_report: Dict[str, ColumnModifications] = {}
 
     if not df.index.is_unique:
-        print("WARNING: DataFrame index is not unique! This could cause issues.")
+        logger.warning("DataFrame index is not unique! This could cause issues.")
 
+    column_validators: Dict[str, List[Tuple[Callable[[pd.Series], pd.Series], str]]] = defaultdict(list)
     for validator_func, columns_to_validate in rules.items():
         validator_name = validator_func.__name__ if hasattr(validator_func, '__name__') else str(validator_func)
         if validator_name == "<lambda>":
@@ -100,58 +260,73 @@ def apply_validations_inplace(
 
         for col_name in columns_to_validate:
             if col_name not in df.columns:
-                print(f"Warning: Column '{col_name}' specified for '{validator_name}' not found. Skipping.")
+                logger.debug("Column '%s' specified for '%s' not found. Skipping.", col_name, validator_name)
                 continue
+            column_validators[col_name].append((validator_func, validator_name))
 
-            series_to_validate = df[col_name]
+    # Each column is read once and all of its validators are combined into one mask.
+    results = _validate_columns(df, column_validators)
 
-            try:
-                invalid_mask = validator_func(series_to_validate)
-                if not df.index.equals(invalid_mask.index):
-                    print(f"  CRITICAL WARNING [{col_name}]: DataFrame index and mask index DO NOT MATCH for validator '{validator_name}'!")
-                    if len(df.index) == len(invalid_mask.index):
-                        print("  Attempting to reindex mask...")
-                        try:
-                            invalid_mask = invalid_mask.reindex(df.index)
-                        except Exception as reindex_e:
-                            print(f"  ERROR: Failed to reindex mask: {reindex_e}. Skipping column.")
-                            continue
-                    else:
-                        print(f"  ERROR: Length mismatch (DF: {len(df.index)}, Mask: {len(invalid_mask.index)}). Skipping column.")
-                        continue
-                invalid_indices = df.index[invalid_mask].tolist()
-            except Exception as e:
-                print(f"  ERROR applying validator '{validator_name}' or getting indices for column '{col_name}': {e}")
-                continue 
-
-            if invalid_indices:
-                print(f"  -> Validator '{validator_name}' found {len(invalid_indices)} invalid entries for '{col_name}'. Recording...")
-                if col_name not in modifications_report:
-                    modifications_report[col_name] = []
-
-                for idx in invalid_indices:
-                    try:
-                        original_value = df.loc[idx, col_name]
-                        record = ModificationRecord(
-                            index=idx,
-                            original_value=original_value,
-                            replaced_value=replacement_value,
-                            validator=validator_name
-                        )
-                        modifications_report[col_name].append(record)
-                    except KeyError:
-                        print(f"  Warning: Index {idx} not found during reporting for column '{col_name}'. Skipping record.")
-                    except Exception as report_e:
-                        print(f"  Error creating report record for index {idx}, col '{col_name}': {report_e}")
+    for col_name, (mask_np, flagged_by) in zip(column_validators, results):
+        invalid_count = np.count_nonzero(mask_np)
+        if not invalid_count:
+            continue
 
-                try:
-                    df.loc[invalid_indices, col_name] = replacement_value
-                except Exception as replace_e:
-                    print(f"  ERROR during replacement in column '{col_name}' by validator '{validator_name}': {replace_e}")
+        logger.debug("Found %d invalid entries for '%s'. Replacing...", invalid_count, col_name)
+        if report:
+            modifications_report[col_name] = ColumnModifications(
+                indices=df.index[mask_np].to_numpy(dtype=object),
+                original_values=df[col_name][mask_np].to_numpy(dtype=object),
+                validators=flagged_by[mask_np],
+                replaced_value=replacement_value
+            )
+
+        try:
+            _replace_invalid(df, col_name, mask_np, replacement_value)
+        except Exception as replace_e:
+            logger.error("Error during replacement in column '%s': %s", col_name, replace_e)
 
     return modifications_report
 
 
+DEFAULT_SCHEMA: Tuple[Tuple[str, Callable[[pd.Series], pd.Series]], ...] = (
+    ('ip', is_invalid_ipv4),
+    ('cpu_cores', is_invalid_positive_numeric),
+    ('cpu_freq', is_invalid_positive_numeric),
+    ('ram', is_invalid_positive_numeric),
+    ('total_volume', is_invalid_positive_numeric),
+    ('created_on', is_invalid_date),
+    ('updated_on', is_invalid_date),
+)
+DEFAULT_DATE_COLUMNS = ('created_on', 'updated_on')
+
+
+def validate_default_schema(df: pd.DataFrame, replacement_value: Any = ' ', max_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Cleans and validates the columns of DEFAULT_SCHEMA in-place and returns the DataFrame.
+
+    Same result as remove_microseconds_regex_inplace on the date columns followed by
+    apply_validations_inplace with the equivalent rules and report=False, without building
+    a rules dict. max_workers caps the threads used to validate columns concurrently.
+    """
+    remove_microseconds_regex_inplace(df, [col_name for col_name in DEFAULT_DATE_COLUMNS if col_name in df.columns])
+
+    column_validators = {
+        col_name: [(validator_func, validator_func.__name__)]
+        for col_name, validator_func in DEFAULT_SCHEMA if col_name in df.columns
+    }
+    results = _validate_columns(df, column_validators, max_workers)
+
+    for col_name, (mask_np, _) in zip(column_validators, results):
+        if not mask_np.any():
+            continue
+        try:
+            _replace_invalid(df, col_name, mask_np, replacement_value)
+        except Exception as replace_e:
+            logger.error("Error during replacement in column '%s': %s", col_name, replace_e)
+    return df
+
+
 class CsvValidator(ValidatorInterface):
     """
     Concrete implementation of ValidatorInterface for CSV files represented as a pandas DataFrame.
@@ -163,7 +338,7 @@ class CsvValidator(ValidatorInterface):
         """
         Applies the validation rules to the internal DataFrame and returns the modified DataFrame.
         """
-        apply_validations_inplace(self._dataframe, rules, replacement_value)
+        apply_validations_inplace(self._dataframe, rules, replacement_value, report=False)
         return self._dataframe
 
     def get_dataframe(self) -> pd.DataFrame:
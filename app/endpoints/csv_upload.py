@@ -1,4 +1,5 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import ORJSONResponse
 from slugify import slugify
 import csv
 import io
@@ -28,7 +29,7 @@ class CsvProcessor:
 csv_processor = CsvProcessor()
 
 
-@router.post(f"/{endpoint_path}", summary="Endpoint to upload and process CSV files")
+@router.post(f"/{endpoint_path}", summary="Endpoint to upload and process CSV files", response_class=ORJSONResponse)
 async def csv_upload(file: UploadFile = File(...)):
     """
     Upload a CSV file and process its contents.
@@ -38,7 +39,8 @@ async def csv_upload(file: UploadFile = File(...)):
     """
     try:
         data = await csv_processor.process_csv(file)
-        return {"success": True, "data": data}
+        # Returned directly so the rows skip jsonable_encoder and go straight to orjson.
+        return ORJSONResponse({"success": True, "data": data})
     except ValueError as err:
         raise HTTPException(status_code=400, detail=str(err)) 
     
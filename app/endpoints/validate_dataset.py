@@ -1,12 +1,131 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Response
+from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import StreamingResponse
 from slugify import slugify
-import io
+import asyncio
+import csv
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 import pandas as pd
-from app.core.validator import CsvValidator, is_invalid_date, is_invalid_ipv4, is_invalid_positive_numeric, remove_microseconds_regex_inplace
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from typing import BinaryIO, Iterator, List, Optional
+from app.core.validator import validate_default_schema
 
 router = APIRouter()
 endpoint_path = slugify('validate_dataset')
 
+_CSV_READ_OPTIONS = pacsv.ReadOptions(use_threads=True)
+# Quoted values may span lines, as pd.read_csv allowed; without this Arrow can split
+# such a row across parse blocks on large files.
+_CSV_PARSE_OPTIONS = pacsv.ParseOptions(newlines_in_values=True)
+
+# Validation is CPU-bound, so it runs in worker processes to keep the event loop free.
+_WORKERS = os.cpu_count() or 1
+
+# Uploads are split into at most one shard per worker, but never into shards smaller
+# than this, where pickling to and from the workers would outweigh the gain.
+_MIN_SHARD_ROWS = 250_000
+
+# Rows serialized per chunk of the streamed CSV response.
+_CSV_CHUNK_ROWS = 50_000
+
+# Submitted straight from app.core, so workers never import this module. Each worker
+# validates its shard's columns on one thread, since the pool already runs one shard per CPU.
+_VALIDATE_SHARD = partial(validate_default_schema, max_workers=1)
+
+# Started on first use and reused across requests; see _get_pool.
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """
+    Returns the validation pool, creating it on first use. Workers come from a forkserver
+    rather than a fork of the serving process, so they never inherit its threads or held locks.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=_WORKERS, mp_context=multiprocessing.get_context("forkserver"))
+    return _pool
+
+
+def _discard_pool(broken: ProcessPoolExecutor) -> None:
+    """Drops a pool whose worker died, so the next request starts a fresh one."""
+    global _pool
+    if _pool is broken:
+        _pool = None
+    broken.shutdown(wait=False)
+
+
+def shutdown_pool() -> None:
+    """Stops the validation workers, if any were started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def _read_header(source: BinaryIO) -> List[str]:
+    """Reads the header row of a binary CSV stream, then rewinds the stream."""
+    lines = (line.decode('utf-8-sig') for line in iter(source.readline, b''))
+    header = next(csv.reader(lines), None)
+    source.seek(0)
+    if header is None:
+        raise ValueError("CSV file is empty.")
+    return header
+
+
+def _dedupe_names(names: List[str]) -> List[str]:
+    """Renames repeated column names to 'name.1', 'name.2', ... the way pd.read_csv does."""
+    taken = set(names)
+    seen = set()
+    deduped = []
+    for name in names:
+        if name in seen:
+            suffix = 1
+            while f"{name}.{suffix}" in taken:
+                suffix += 1
+            name = f"{name}.{suffix}"
+            taken.add(name)
+        seen.add(name)
+        deduped.append(name)
+    return deduped
+
+
+def _read_csv(source: BinaryIO) -> pd.DataFrame:
+    """Parses a CSV file with Arrow's multithreaded reader into an Arrow-backed DataFrame."""
+    # Every column is read as text, so values pass through unchanged unless a validator
+    # replaces them, and invalid UTF-8 fails the parse instead of becoming binary.
+    convert_options = pacsv.ConvertOptions(
+        column_types={col_name: pa.string() for col_name in _read_header(source)},
+        strings_can_be_null=True
+    )
+    table = pacsv.read_csv(
+        pa.PythonFile(source, mode='r'),
+        read_options=_CSV_READ_OPTIONS,
+        parse_options=_CSV_PARSE_OPTIONS,
+        convert_options=convert_options
+    )
+    # Arrow keeps repeated header names as-is, which would make df[name] ambiguous.
+    table = table.rename_columns(_dedupe_names(table.column_names))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _split_rows(df: pd.DataFrame) -> List[pd.DataFrame]:
+    """Splits the DataFrame row-wise into contiguous shards for the validation pool."""
+    shard_rows = max(_MIN_SHARD_ROWS, -(-len(df) // _WORKERS))
+    return [df.iloc[start:start + shard_rows] for start in range(0, len(df), shard_rows)] or [df]
+
+
+def _iter_csv(df: pd.DataFrame) -> Iterator[str]:
+    """Yields the DataFrame as CSV text, serializing one block of rows at a time."""
+    yield df.iloc[:0].to_csv(index=False)
+    for start in range(0, len(df), _CSV_CHUNK_ROWS):
+        yield df.iloc[start:start + _CSV_CHUNK_ROWS].to_csv(index=False, header=False)
+
+
 @router.post(f"/{endpoint_path}", summary="Endpoint to validate any dataset (CSV) using default rules")
 async def validate_dataset(file: UploadFile = File(...)):
     """
@@ -25,20 +144,19 @@ async def validate_dataset(file: UploadFile = File(...)):
     if not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are supported.")
     try:
-        file_contents = await file.read()
-        df = pd.read_csv(io.StringIO(file_contents.decode("utf-8")))
+        df = await asyncio.to_thread(_read_csv, file.file)
     except Exception as e:
         raise HTTPException(status_code=400, detail="Failed to read CSV file.")
-    
-    rules = {
-        is_invalid_ipv4: ['ip'],
-        is_invalid_positive_numeric: ['cpu_cores', 'cpu_freq', 'ram', 'total_volume'],
-        is_invalid_date: ['created_on', 'updated_on']
-    }
-    remove_microseconds_regex_inplace(df, ['created_on', 'updated_on'])
-    
-    validator = CsvValidator(df)
-    modified_df = validator.validate(rules)
-    
-    csv_data = modified_df.to_csv(index=False)
-    return Response(content=csv_data, media_type="text/csv") 
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    try:
+        shards = await asyncio.gather(*(
+            loop.run_in_executor(pool, _VALIDATE_SHARD, shard) for shard in _split_rows(df)
+        ))
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise HTTPException(status_code=500, detail="Failed to validate CSV file.")
+    modified_df = pd.concat(shards)
+
+    return StreamingResponse(_iter_csv(modified_df), media_type="text/csv")
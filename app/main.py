@@ -1,13 +1,22 @@
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.endpoints.csv_upload import router as csv_upload_router
-from app.endpoints.validate_dataset import router as validate_dataset_router
+from app.endpoints.validate_dataset import router as validate_dataset_router, shutdown_pool
 
+logging.basicConfig(level=logging.WARNING)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_pool()
 
 app = FastAPI(
     title="Data Processing API",
     description="Uploads CSV files and processes them using validation rules.",
-    version="1.0"
+    version="1.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(